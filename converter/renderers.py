@@ -0,0 +1,25 @@
+"""
+Response renderers for the converter API.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    DRF renderer backed by orjson.
+
+    The stock JSONRenderer funnels every value through stdlib
+    json.dumps with a Python-level default hook; orjson encodes the
+    whole payload in C. Large conversion responses stream outside DRF
+    already, so this mainly speeds up error bodies and the health/info
+    payloads while keeping them byte-compatible JSON.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
@@ -2,9 +2,20 @@
 Serializers for Excel conversion API.
 """
 import json
-import magic
+import os
+import threading
+import zipfile
 from rest_framework import serializers
 
+# Magic-number signature for the legacy Excel format
+XLS_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # .xls files are OLE2 compound files
+
+# Upload limits and whitelists, precomputed once at import time
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_FILE_SIZE_MB = MAX_FILE_SIZE // (1024 * 1024)
+ALLOWED_EXTENSIONS = ('.xlsx', '.xls')  # tuple form feeds str.endswith directly
+ALLOWED_EXTENSIONS_DISPLAY = '.xlsx, .xls'
+
 
 class ExcelFileUploadSerializer(serializers.Serializer):
     """
@@ -17,79 +28,57 @@ class ExcelFileUploadSerializer(serializers.Serializer):
         """
         Validate uploaded file is a valid Excel file.
         """
+        # Check if file is empty (metadata only - no bytes read)
+        if value.size == 0:
+            raise serializers.ValidationError("Uploaded file is empty.")
+
         # Check file size (100MB limit)
-        max_size = 100 * 1024 * 1024  # 100MB
-        if value.size > max_size:
+        if value.size > MAX_FILE_SIZE:
+            # Integer-only MB formatting: whole MB via the shift, remainder
+            # scaled to a single decimal digit - no float round-trip
+            mb = value.size >> 20
+            tenths = ((value.size & ((1 << 20) - 1)) * 10) >> 20
+            raise serializers.ValidationError(
+                f"File size too large. Maximum allowed size is {MAX_FILE_SIZE_MB}MB. "
+                f"Uploaded file is {mb}.{tenths}MB."
+            )
+
+        # Check file extension (FileField values always carry a name);
+        # str.endswith with a tuple scans once in C, and the dotted
+        # extension string is only materialized for the error message
+        name_lower = value.name.lower()
+        if not name_lower.endswith(ALLOWED_EXTENSIONS):
+            file_extension = os.path.splitext(name_lower)[1]
             raise serializers.ValidationError(
-                f"File size too large. Maximum allowed size is {max_size / (1024 * 1024):.0f}MB. "
-                f"Uploaded file is {value.size / (1024 * 1024):.1f}MB."
+                f"Invalid file extension '{file_extension}'. "
+                f"Allowed extensions: {ALLOWED_EXTENSIONS_DISPLAY}"
             )
 
-        # Check file extension
-        allowed_extensions = ['.xlsx', '.xls']
-        file_extension = None
-        if hasattr(value, 'name') and value.name:
-            file_extension = '.' + value.name.split('.')[-1].lower()
-            if file_extension not in allowed_extensions:
-                raise serializers.ValidationError(
-                    f"Invalid file extension '{file_extension}'. "
-                    f"Allowed extensions: {', '.join(allowed_extensions)}"
-                )
-
-        # Validate file type using python-magic (more reliable than extension)
+        # Validate file content for the extension; no trailing seek(0)
+        # needed after either check - UploadedFile.chunks() rewinds on
+        # its own. The try block covers only the I/O so validation
+        # rejections raise with clean tracebacks outside it.
         try:
-            # Read first few bytes to determine file type
             value.seek(0)
-            file_header = value.read(1024)
-            value.seek(0)  # Reset file pointer
-            
-            mime_type = magic.from_buffer(file_header, mime=True)
-            
-            # Valid MIME types for Excel files
-            valid_mime_types = [
-                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',  # .xlsx
-                'application/vnd.ms-excel',  # .xls
-                'application/zip',  # Sometimes .xlsx files are detected as zip
-                'application/octet-stream',  # Generic binary, but check extension
-            ]
-            
-            if mime_type not in valid_mime_types:
-                raise serializers.ValidationError(
-                    f"Invalid file type. Expected Excel file (.xlsx/.xls), "
-                    f"but got '{mime_type}'. File extension: {file_extension}"
-                )
-            
-            # Additional validation for generic mime types
-            if mime_type in ['application/octet-stream', 'application/zip']:
-                if file_extension not in allowed_extensions:
-                    raise serializers.ValidationError(
-                        f"File type '{mime_type}' requires valid Excel extension. "
-                        f"Got '{file_extension}', expected one of: {', '.join(allowed_extensions)}"
-                    )
-                
-                # For .xlsx files, check if it's actually a ZIP archive (which .xlsx files are)
-                if file_extension == '.xlsx':
-                    # Check for ZIP file signature (PK header)
-                    if len(file_header) >= 4 and file_header[:2] == b'PK':
-                        # This is likely a valid .xlsx file (ZIP-based format)
-                        pass
-                    else:
-                        raise serializers.ValidationError(
-                            "File appears to be corrupted or not a valid Excel file"
-                        )
-                        
-        except serializers.ValidationError:
-            # Re-raise validation errors as-is
-            raise
+            if name_lower.endswith('.xlsx'):
+                # .xlsx is a ZIP archive; checking the end-of-central-directory
+                # record (last ~22 bytes) rejects truncated or corrupted
+                # archives that a bare PK-header check would let through to
+                # the much more expensive XML parser
+                content_ok = zipfile.is_zipfile(value)
+            else:
+                # Read just enough bytes for the OLE2 signature
+                content_ok = value.read(8).startswith(XLS_SIGNATURE)
         except Exception as e:
-            # For other exceptions, provide a more user-friendly message
+            # For I/O errors, provide a more user-friendly message
             raise serializers.ValidationError(
                 f"Unable to validate file: {str(e)}. Please ensure the file is a valid Excel file."
             )
 
-        # Check if file is empty
-        if value.size == 0:
-            raise serializers.ValidationError("Uploaded file is empty.")
+        if not content_ok:
+            raise serializers.ValidationError(
+                "File appears to be corrupted or not a valid Excel file"
+            )
 
         return value
     
@@ -125,7 +114,56 @@ class ExcelFileUploadSerializer(serializers.Serializer):
         return parsed_data
 
 
-class ExcelConversionResponseSerializer(serializers.Serializer):
+_thread_serializers = threading.local()
+
+
+def get_upload_serializer(data):
+    """
+    Return a reusable per-thread ExcelFileUploadSerializer bound to data.
+
+    Instantiating a serializer deep-copies every declared field, which
+    the convert endpoint paid on each request. One instance per worker
+    thread is rebound instead: the incoming data replaces initial_data
+    and the validation state cached by the previous is_valid() run is
+    dropped.
+    """
+    serializer = getattr(_thread_serializers, 'upload', None)
+    if serializer is None:
+        serializer = ExcelFileUploadSerializer()
+        _thread_serializers.upload = serializer
+    serializer.initial_data = data
+    try:
+        del serializer._validated_data
+    except AttributeError:
+        pass
+    try:
+        del serializer._errors
+    except AttributeError:
+        pass
+    return serializer
+
+
+class CachedFieldsMixin:
+    """
+    Cache bound field instances on the serializer class.
+
+    DRF deep-copies every declared Field each time a serializer is
+    instantiated. The response serializers below are created per request
+    purely to shape output, so build the bound fields once and reuse them
+    for every subsequent instantiation.
+    """
+
+    @property
+    def fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().fields
+            cls._cached_fields = cached
+        return cached
+
+
+class ExcelConversionResponseSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for successful Excel conversion response.
     """
@@ -147,7 +185,7 @@ class ExcelConversionResponseSerializer(serializers.Serializer):
     )
 
 
-class ErrorResponseSerializer(serializers.Serializer):
+class ErrorResponseSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for error responses.
     """
@@ -157,7 +195,7 @@ class ErrorResponseSerializer(serializers.Serializer):
     )
 
 
-class HealthCheckResponseSerializer(serializers.Serializer):
+class HealthCheckResponseSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for health check response.
     """
@@ -3,16 +3,25 @@ Utilities for Excel file processing with streaming and batching support.
 """
 import logging
 import os
+import shutil
+import sys
 import tempfile
 import time
+from contextlib import contextmanager
+from itertools import chain, islice
 from typing import Iterator, List, Dict, Any, Tuple
 import psutil
-import openpyxl
-import xlrd
-from openpyxl.utils.exceptions import InvalidFileException
+
+# openpyxl and xlrd are imported lazily inside the processing functions so
+# that workers which never touch an upload (e.g. ones serving /health)
+# don't pay their import cost at boot
 
 logger = logging.getLogger('converter')
 
+# One process handle per worker - psutil.Process() re-resolves the pid and
+# /proc paths on every construction, so reuse a single instance
+_PROCESS = psutil.Process()
+
 
 class ExcelProcessingError(Exception):
     """Custom exception for Excel processing errors."""
@@ -20,26 +29,38 @@ class ExcelProcessingError(Exception):
 
 
 class MemoryMonitor:
-    """Monitor memory usage during processing."""
-    
+    """
+    Monitor memory usage during processing.
+
+    Readings come from /proc via psutil, a syscall per call, so updates
+    are sampled: only every SAMPLE_INTERVAL-th update_peak() refreshes
+    the reading and the cached value is reused in between.
+    """
+
+    SAMPLE_INTERVAL = 16
+
     def __init__(self):
-        self.process = psutil.Process()
+        self.process = _PROCESS
         self.initial_memory = self.get_memory_usage()
         self.peak_memory = self.initial_memory
-    
+        self._cached = self.initial_memory
+        self._tick = 0
+
     def get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
+        """Get current memory usage in MB (always a fresh reading)."""
         return self.process.memory_info().rss / (1024 * 1024)
-    
+
     def update_peak(self):
-        """Update peak memory usage."""
-        current = self.get_memory_usage()
-        if current > self.peak_memory:
-            self.peak_memory = current
-    
+        """Update peak memory usage from a sampled reading."""
+        if self._tick % self.SAMPLE_INTERVAL == 0:
+            self._cached = self.get_memory_usage()
+            if self._cached > self.peak_memory:
+                self.peak_memory = self._cached
+        self._tick += 1
+
     def get_memory_info(self) -> Dict[str, float]:
-        """Get memory usage information."""
-        current = self.get_memory_usage()
+        """Get memory usage information from the sampled reading."""
+        current = self._cached
         return {
             'current_mb': current,
             'peak_mb': self.peak_memory,
@@ -71,84 +92,108 @@ def batch_rows(rows: Iterator, batch_size: int = 1000) -> Iterator[List]:
         yield batch
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _strip_or_none(value: str) -> Any:
+    return value.strip() if value else None
+
+
+def _stringify(value: Any) -> Any:
+    str_value = str(value)
+    return str_value.strip() if str_value else None
+
+
+# Exact-type dispatch for cell processing: one C-level dict lookup instead
+# of an isinstance chain walking the MRO for every cell
+_CELL_DISPATCH = {
+    type(None): _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    str: _strip_or_none,
+}
+
+
 def process_cell_value(cell_value: Any) -> Any:
     """
     Process individual cell value to ensure proper JSON serialization.
-    
+
     Args:
         cell_value: Raw cell value from Excel
-        
+
     Returns:
         Processed value suitable for JSON
     """
-    if cell_value is None:
-        return None
-    
-    # Handle different cell types
-    if isinstance(cell_value, (int, float)):
-        # Keep numbers as numbers
-        return cell_value
-    elif isinstance(cell_value, str):
-        # Clean up string values
-        return cell_value.strip() if cell_value else None
-    else:
-        # Convert other types to string
-        str_value = str(cell_value)
-        return str_value.strip() if str_value else None
+    return _CELL_DISPATCH.get(type(cell_value), _stringify)(cell_value)
 
 
-def get_column_headers(worksheet, file_type: str) -> Tuple[List[str], List[str], int]:
+def _rfind_nonempty(row_values) -> int:
     """
-    Extract column headers from the Excel file.
-    For files with title rows, we need to find the actual headers.
-    
+    Return the index of the last cell with meaningful data, or -1.
+
+    Scans from the right and stops at the first hit instead of walking
+    the whole row forward just to remember the final match.
+    """
+    for i in range(len(row_values) - 1, -1, -1):
+        cell = row_values[i]
+        if cell is not None and str(cell).strip():
+            return i
+    return -1
+
+
+# Shared, lazily grown cache of placeholder column names. Both the
+# header pass and _build_column_names fall back to these for unnamed
+# columns; formatting them once avoids an f-string per empty cell.
+_EMPTY_NAMES = ['__EMPTY']
+
+
+def _empty_name(i: int) -> str:
+    """Return the cached placeholder name for column position i."""
+    names = _EMPTY_NAMES
+    while len(names) <= i:
+        names.append(sys.intern(f'__EMPTY_{len(names)}'))
+    return names[i]
+
+
+def get_column_headers_from_rows(first_row, second_row, max_columns, file_type: str = 'xlsx') -> Tuple[List[str], List[str], int]:
+    """
+    Build header metadata from the first two rows of a sheet.
+
+    Split out of get_column_headers so callers that already hold the rows
+    (e.g. a single streaming pass over an xlsx file) can derive headers
+    without opening fresh row iterators.
+
     Args:
-        worksheet: Excel worksheet object
+        first_row: Values of the first sheet row (might be a title row)
+        second_row: Values of the second sheet row (likely actual headers)
+        max_columns: Column count reported by the sheet, or None
         file_type: Type of file ('xlsx' or 'xls')
-        
+
     Returns:
         Tuple of (title_row_headers, actual_headers, max_columns)
     """
     title_headers = []
     actual_headers = []
-    max_columns = 0
-    
+    empty_counter = 0
+
     try:
         if file_type == 'xlsx':
-            # For openpyxl (xlsx files)
-            # Get first row (might be title)
-            first_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True))
-            
-            # Get second row (likely actual headers)
-            try:
-                second_row = next(worksheet.iter_rows(min_row=2, max_row=2, values_only=True))
-            except StopIteration:
-                second_row = first_row  # Only one row
-            
             # Process headers with correct __EMPTY numbering
-            title_headers = []
-            actual_headers = []
-            empty_counter = 0
-            
             for i, (title_cell, actual_cell) in enumerate(zip(first_row, second_row)):
                 # For title headers (used as keys)
                 try:
                     if title_cell is not None and str(title_cell).strip():
                         title_headers.append(str(title_cell))
                     else:
-                        if empty_counter == 0:
-                            title_headers.append("__EMPTY")
-                        else:
-                            title_headers.append(f"__EMPTY_{empty_counter}")
+                        title_headers.append(_empty_name(empty_counter))
                         empty_counter += 1
                 except Exception:
                     # If any error in processing title cell, treat as empty
-                    if empty_counter == 0:
-                        title_headers.append("__EMPTY")
-                    else:
-                        title_headers.append(f"__EMPTY_{empty_counter}")
+                    title_headers.append(_empty_name(empty_counter))
                     empty_counter += 1
-                
+
                 # For actual headers (used as values in first object)
                 try:
                     if actual_cell is not None:
@@ -158,127 +203,262 @@ def get_column_headers(worksheet, file_type: str) -> Tuple[List[str], List[str],
                 except Exception:
                     # If any error in processing actual cell, use None
                     actual_headers.append(None)
-            
-            max_columns = worksheet.max_column
-            # Handle case where max_column is None
-            if max_columns is None:
-                max_columns = max(len(title_headers), len(actual_headers)) if (title_headers or actual_headers) else 1
         else:
-            # For xlrd (xls files)
-            if worksheet.nrows > 0:
-                first_row = worksheet.row_values(0)
-                second_row = worksheet.row_values(1) if worksheet.nrows > 1 else first_row
-                
-                # Process headers with correct __EMPTY numbering
-                title_headers = []
-                actual_headers = []
-                empty_counter = 0
-                
-                for i, (title_cell, actual_cell) in enumerate(zip(first_row, second_row)):
-                    # For title headers (used as keys)
-                    try:
-                        if title_cell and str(title_cell).strip():
-                            title_headers.append(str(title_cell))
-                        else:
-                            if empty_counter == 0:
-                                title_headers.append("__EMPTY")
-                            else:
-                                title_headers.append(f"__EMPTY_{empty_counter}")
-                            empty_counter += 1
-                    except Exception:
-                        # If any error in processing title cell, treat as empty
-                        if empty_counter == 0:
-                            title_headers.append("__EMPTY")
-                        else:
-                            title_headers.append(f"__EMPTY_{empty_counter}")
+            # For xlrd (xls files) empty cells are '' rather than None,
+            # so plain truthiness decides what counts as empty
+            for i, (title_cell, actual_cell) in enumerate(zip(first_row, second_row)):
+                # For title headers (used as keys)
+                try:
+                    if title_cell and str(title_cell).strip():
+                        title_headers.append(str(title_cell))
+                    else:
+                        title_headers.append(_empty_name(empty_counter))
                         empty_counter += 1
-                    
-                    # For actual headers (used as values in first object)
-                    try:
-                        if actual_cell:
-                            actual_headers.append(str(actual_cell))
-                        else:
-                            actual_headers.append(None)
-                    except Exception:
-                        # If any error in processing actual cell, use None
+                except Exception:
+                    # If any error in processing title cell, treat as empty
+                    title_headers.append(_empty_name(empty_counter))
+                    empty_counter += 1
+
+                # For actual headers (used as values in first object)
+                try:
+                    if actual_cell:
+                        actual_headers.append(str(actual_cell))
+                    else:
                         actual_headers.append(None)
-                    
-                max_columns = worksheet.ncols
-    
+                except Exception:
+                    # If any error in processing actual cell, use None
+                    actual_headers.append(None)
+
     except Exception as e:
         logger.error(f"Error extracting headers: {str(e)}")
         raise ExcelProcessingError(f"Failed to extract column headers: {str(e)}")
-    
-    # Determine which row contains the actual headers
-    # If the second row looks more like headers (contains text like "NO.", "NAME", etc.)
-    # and first row looks like a title, use the structure accordingly
-    
-    # For the format you showed, we want:
-    # - First object: title_header -> actual_header mapping
-    # - Subsequent objects: title_header -> data mapping
-    
-    # Don't trim headers - we'll handle empty columns dynamically per row
-    # This allows each row to have different column structures
-    
+
+    # Handle case where max_columns is None
+    if max_columns is None:
+        max_columns = max(len(title_headers), len(actual_headers)) if (title_headers or actual_headers) else 1
+
     # Ensure we have at least some headers
     if not title_headers and not actual_headers:
         raise ExcelProcessingError("No headers found in Excel file")
-    
-    # Handle duplicate headers by adding suffixes for title headers
-    seen_headers = {}
+
+    # Handle duplicate headers by suffixing repeats: name, name_1, name_2.
+    # (Repeats used to be replaced with __EMPTY_<index>, which threw away
+    # the real column name.) Placeholder names are already unique per row.
+    counts = {}
     unique_title_headers = []
-    for i, header in enumerate(title_headers):
-        if header in seen_headers:
-            seen_headers[header] += 1
-            unique_title_headers.append(f"__EMPTY" if i == 0 else f"__EMPTY_{i}")
-        else:
-            seen_headers[header] = 0
-            unique_title_headers.append(header)
-    
+    for header in title_headers:
+        c = counts.get(header, 0)
+        unique_title_headers.append(header if c == 0 else f"{header}_{c}")
+        counts[header] = c + 1
+
     return unique_title_headers, actual_headers, max_columns
 
 
-def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None, limit: int = None) -> Iterator[Dict[str, Any]]:
+def get_column_headers(worksheet, file_type: str) -> Tuple[List[str], List[str], int]:
     """
-    Process XLSX file using openpyxl with streaming support and optional pagination.
+    Extract column headers from the Excel file.
+    For files with title rows, we need to find the actual headers.
     
+    Args:
+        worksheet: Excel worksheet object
+        file_type: Type of file ('xlsx' or 'xls')
+        
+    Returns:
+        Tuple of (title_row_headers, actual_headers, max_columns)
+    """
+    try:
+        if file_type == 'xlsx':
+            # For openpyxl (xlsx files)
+            # Get first row (might be title)
+            first_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True))
+
+            # Get second row (likely actual headers)
+            try:
+                second_row = next(worksheet.iter_rows(min_row=2, max_row=2, values_only=True))
+            except StopIteration:
+                second_row = first_row  # Only one row
+
+            max_columns = worksheet.max_column
+        else:
+            # For xlrd (xls files)
+            if worksheet.nrows > 0:
+                first_row = worksheet.row_values(0)
+                second_row = worksheet.row_values(1) if worksheet.nrows > 1 else first_row
+            else:
+                first_row = second_row = []
+            max_columns = worksheet.ncols
+
+    except Exception as e:
+        logger.error(f"Error extracting headers: {str(e)}")
+        raise ExcelProcessingError(f"Failed to extract column headers: {str(e)}")
+
+    return get_column_headers_from_rows(first_row, second_row, max_columns, file_type)
+
+
+class _PreloadedWorksheet:
+    """
+    Minimal worksheet adapter over rows already materialized in memory.
+
+    Exposes just enough of openpyxl's read-only worksheet API
+    (iter_rows/max_column) for the existing header-extraction and
+    batching code to consume rows bulk-loaded by calamine unchanged.
+    """
+
+    def __init__(self, rows: List[List[Any]]):
+        self._rows = rows
+
+    @staticmethod
+    def _normalize(row) -> tuple:
+        # calamine surfaces every Excel number as float; fold integral
+        # floats back to int to match openpyxl's output
+        return tuple(
+            int(cell) if cell.__class__ is float and cell.is_integer() else cell
+            for cell in row
+        )
+
+    def iter_rows(self, min_row: int = 1, max_row: int = None, values_only: bool = True):
+        end = len(self._rows) if max_row is None else max_row
+        for row in self._rows[min_row - 1:end]:
+            yield self._normalize(row)
+
+    def slice_batches(self, min_row: int, max_row: int, batch_size: int) -> Iterator[List[tuple]]:
+        """
+        Yield batches of normalized rows via C-level list slicing.
+
+        With the whole sheet already materialized there is no need to
+        funnel rows one-by-one through batch_rows' append loop.
+        """
+        normalize = self._normalize
+        for start in range(min_row - 1, max_row, batch_size):
+            yield [normalize(row) for row in self._rows[start:min(start + batch_size, max_row)]]
+
+    @property
+    def max_column(self):
+        return max(map(len, self._rows)) if self._rows else None
+
+
+def _build_column_names(title_headers: List[str], max_columns: int) -> List[str]:
+    """
+    Precompute the output column name for every column position.
+
+    The row loops previously re-derived each name per cell per row
+    (startswith check plus f-string formatting); with the table built
+    once, the inner loop is a single indexed lookup.
+    """
+    width = max(max_columns, len(title_headers))
+    # Interned names make the per-row dict inserts hash/compare by
+    # pointer, and every row of the response shares one string object
+    # per column instead of fresh copies
+    return [
+        sys.intern(title_headers[i])
+        if i < len(title_headers) and title_headers[i] and not title_headers[i].startswith('__EMPTY')
+        else _empty_name(i)
+        for i in range(width)
+    ]
+
+
+class _PreloadedXlsSheet:
+    """
+    Minimal xlrd-style sheet adapter (nrows/ncols/row_values) over rows
+    already materialized by calamine, so the .xls processing loop runs
+    unchanged against either backend.
+    """
+
+    def __init__(self, rows: List[List[Any]]):
+        self._rows = rows
+        self.nrows = len(rows)
+        self.ncols = max(map(len, rows)) if rows else 0
+
+    def row_values(self, row_idx: int) -> List[Any]:
+        return self._rows[row_idx]
+
+
+def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None, limit: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Process XLSX file with streaming support and optional pagination.
+
+    Rows are bulk-read through python-calamine (Rust-backed, one FFI call
+    for the whole sheet) when it is installed, falling back to openpyxl's
+    read-only per-cell iteration otherwise.
+
     Args:
         file_path: Path to the XLSX file
         batch_size: Number of rows to process in each batch
         page: Page number for pagination (1-based, optional)
         limit: Number of rows per page (optional)
-        
+
     Yields:
         Dictionary containing batch processing results
     """
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
     memory_monitor = MemoryMonitor()
-    start_time = time.time()
-    
+    start_time = time.monotonic()
+    last_log_time = start_time
+    workbook = None
+
     try:
-        # Load workbook in read-only mode for memory efficiency
-        logger.info(f"Loading XLSX file: {file_path}")
-        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        worksheet = workbook.active
-        
-        # Get total rows for progress tracking
-        total_rows = worksheet.max_row
-        logger.info(f"Total rows detected: {total_rows}")
-        
-        # Handle cases where max_row is None
-        if total_rows is None:
-            # Try to estimate by iterating through rows to find the last non-empty row
-            total_rows = 0
-            try:
-                for row in worksheet.iter_rows():
-                    if any(cell.value is not None for cell in row):
-                        total_rows = row[0].row
-            except:
-                total_rows = 1000  # Default estimate for progress calculation
-        
+        if CalamineWorkbook is not None:
+            # Bulk-read the sheet in one call; type coercion and row
+            # materialization happen in compiled Rust code
+            logger.info(f"Loading XLSX file via calamine: {file_path}")
+            sheet_rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python(skip_empty_area=False)
+            worksheet = _PreloadedWorksheet(sheet_rows)
+            total_rows = len(sheet_rows)
+            logger.info(f"Total rows detected: {total_rows}")
+        else:
+            import openpyxl
+
+            # Load workbook in read-only mode for memory efficiency
+            logger.info(f"Loading XLSX file: {file_path}")
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            worksheet = workbook.active
+
+            # Get total rows for progress tracking
+            total_rows = worksheet.max_row
+            logger.info(f"Total rows detected: {total_rows}")
+
+            # Handle cases where max_row is None
+            if total_rows is None:
+                # Try to estimate by iterating through rows to find the last non-empty row
+                total_rows = 0
+                try:
+                    for row in worksheet.iter_rows():
+                        if any(cell.value is not None for cell in row):
+                            total_rows = row[0].row
+                except:
+                    total_rows = 1000  # Default estimate for progress calculation
+
         logger.info(f"Effective total rows: {total_rows}")
         
-        # Extract headers from first and second rows
-        title_headers, actual_headers, max_columns = get_column_headers(worksheet, 'xlsx')
+        # Extract headers from first and second rows. The preloaded path
+        # slices its in-memory rows, but openpyxl read-only re-walks the
+        # sheet XML from the top for every iter_rows call - so there a
+        # single streaming iterator supplies both the header rows here
+        # and the data rows further down.
+        row_stream = None
+        if isinstance(worksheet, _PreloadedWorksheet):
+            title_headers, actual_headers, max_columns = get_column_headers(worksheet, 'xlsx')
+        else:
+            row_stream = worksheet.iter_rows(values_only=True)
+            first_row = next(row_stream, None)
+            if first_row is None:
+                raise ExcelProcessingError("No headers found in Excel file")
+            second_row = next(row_stream, None)
+            title_headers, actual_headers, max_columns = get_column_headers_from_rows(
+                first_row,
+                first_row if second_row is None else second_row,
+                worksheet.max_column,
+            )
+            # Put the consumed rows back in front of the stream
+            buffered = [first_row] if second_row is None else [first_row, second_row]
+            row_stream = chain(buffered, row_stream)
+        col_names = _build_column_names(title_headers, max_columns)
         logger.info(f"Headers extracted: {len(title_headers)} columns")
         
         # Yield header information first
@@ -314,55 +494,63 @@ def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None,
                 }
                 return
         
-        # Process data rows in batches with pagination
+        # Process data rows in batches with pagination; materialized rows
+        # are batched by list slicing, streamed rows through batch_rows
         end_row_index = start_row_index + rows_to_process
-        row_iterator = worksheet.iter_rows(min_row=start_row_index, max_row=end_row_index - 1, values_only=True)
+        if isinstance(worksheet, _PreloadedWorksheet):
+            batches = worksheet.slice_batches(start_row_index, end_row_index - 1, batch_size)
+        else:
+            # Continue the header iterator rather than re-parsing from row 1
+            row_iterator = islice(row_stream, start_row_index - 1, max(start_row_index - 1, end_row_index - 1))
+            batches = batch_rows(row_iterator, batch_size)
         batch_count = 0
         total_processed = 0
         row_number = start_row_index - 1  # Adjust for 0-based counting
-        
-        for batch in batch_rows(row_iterator, batch_size):
+
+        # One output list reused across batches: every consumer drains a
+        # batch frame before resuming the generator, so clearing it here
+        # saves a fresh list allocation (and its growth reallocs) per batch
+        batch_data = []
+
+        for batch in batches:
             batch_count += 1
             memory_monitor.update_peak()
             
             # Process batch
-            batch_data = []
+            batch_data.clear()
             for row_values in batch:
                 row_number += 1
-                if row_values and any(cell is not None for cell in row_values):
-                    # Create row dictionary - only include columns with data up to the last meaningful column
-                    row_dict = {}
-                    
-                    # Find the last column with actual data in this row
-                    last_data_col = -1
-                    for i, cell in enumerate(row_values):
-                        if cell is not None and str(cell).strip():
-                            last_data_col = i
-                    
-                    # Only process columns up to the last one with data
-                    if last_data_col >= 0:
-                        for i in range(last_data_col + 1):
-                            cell_value = row_values[i] if i < len(row_values) else None
-                            processed_value = process_cell_value(cell_value)
-                            
-                            # Only include columns that have actual data (not null/empty)
-                            if processed_value is not None and str(processed_value).strip():
-                                # Generate column name dynamically for each row
-                                # Check if this column position has a meaningful header from the first row
-                                if i < len(title_headers) and title_headers[i] and not title_headers[i].startswith('__EMPTY'):
-                                    # Use the actual header from first row
-                                    col_name = title_headers[i]
-                                else:
-                                    # Generate __EMPTY names based on actual column position
-                                    if i == 0:
-                                        col_name = "__EMPTY"
-                                    else:
-                                        col_name = f"__EMPTY_{i}"
-                                
-                                row_dict[col_name] = processed_value
+                # C-level count replaces the per-cell generator predicate
+                if row_values and len(row_values) != row_values.count(None):
+                    # Collect (name, value) pairs for non-empty cells up to
+                    # the last meaningful column, then build the dict in a
+                    # single C-level call - repeated __setitem__ pays
+                    # per-op bytecode and incremental resizes
+                    keys = []
+                    vals = []
+                    last_data_col = _rfind_nonempty(row_values)
+                    for i in range(last_data_col + 1):
+                        cell_value = row_values[i] if i < len(row_values) else None
+                        cls = cell_value.__class__
+                        if cls is str:
+                            # one strip serves both the emptiness test
+                            # and the stored value
+                            s = cell_value.strip()
+                            if s:
+                                keys.append(col_names[i])
+                                vals.append(s)
+                        elif cls is int or cls is float or cls is bool:
+                            # numeric fast path: no stringification at all
+                            keys.append(col_names[i])
+                            vals.append(cell_value)
+                        elif cell_value is not None:
+                            s = str(cell_value).strip()
+                            if s:
+                                keys.append(col_names[i])
+                                vals.append(s)
                     
-                    if row_dict:  # Only add non-empty rows
-                        batch_data.append(row_dict)
+                    if keys:  # Only add non-empty rows
+                        batch_data.append(dict(zip(keys, vals)))
                 
                 total_processed += 1
             
@@ -371,14 +559,21 @@ def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None,
                 progress_percentage = (total_processed / max(total_rows - 1, 1)) * 100
             else:
                 progress_percentage = min(100.0, (total_processed / max(batch_count * batch_size, 1)) * 100)
-            processing_time = time.time() - start_time
-            
-            logger.info(
-                f"Processed batch {batch_count}: {len(batch_data)} rows, "
-                f"Progress: {progress_percentage:.1f}%, "
-                f"Memory: {memory_monitor.get_memory_info()['current_mb']:.1f}MB"
-            )
+            now = time.monotonic()
+            processing_time = now - start_time
             
+            memory_info = memory_monitor.get_memory_info()
+            # Sampled progress logging: a write per batch turns into real
+            # I/O on big files, so log the first batch and then at most
+            # once per second
+            if batch_count == 1 or now - last_log_time >= 1.0:
+                last_log_time = now
+                logger.info(
+                    f"Processed batch {batch_count}: {len(batch_data)} rows, "
+                    f"Progress: {progress_percentage:.1f}%, "
+                    f"Memory: {memory_info['current_mb']:.1f}MB"
+                )
+
             yield {
                 'type': 'batch',
                 'data': batch_data,
@@ -387,11 +582,11 @@ def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None,
                 'total_processed': total_processed,
                 'progress_percentage': progress_percentage,
                 'processing_time': processing_time,
-                'memory_info': memory_monitor.get_memory_info()
+                'memory_info': memory_info
             }
         
         # Final summary
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         final_memory = memory_monitor.get_memory_info()
         
         logger.info(
@@ -416,15 +611,19 @@ def process_xlsx_file(file_path: str, batch_size: int = 1000, page: int = None,
         logger.error(f"Error processing XLSX file: {str(e)}")
         raise ExcelProcessingError(f"Failed to process XLSX file: {str(e)}")
     finally:
-        try:
-            workbook.close()
-        except:
-            pass
+        if workbook is not None:
+            try:
+                workbook.close()
+            except:
+                pass
 
 
 def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, limit: int = None) -> Iterator[Dict[str, Any]]:
     """
-    Process XLS file using xlrd with batching support and optional pagination.
+    Process XLS file with batching support and optional pagination.
+
+    Rows are bulk-read through python-calamine when it is installed,
+    falling back to xlrd's per-row access otherwise.
     
     Args:
         file_path: Path to the XLS file
@@ -435,15 +634,29 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
     Yields:
         Dictionary containing batch processing results
     """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
     memory_monitor = MemoryMonitor()
-    start_time = time.time()
-    
+    start_time = time.monotonic()
+    last_log_time = start_time
+
     try:
-        # Open XLS file
-        logger.info(f"Loading XLS file: {file_path}")
-        workbook = xlrd.open_workbook(file_path)
-        worksheet = workbook.sheet_by_index(0)  # Use first sheet
-        
+        if CalamineWorkbook is not None:
+            # calamine reads legacy .xls with the same Rust backend as .xlsx
+            logger.info(f"Loading XLS file via calamine: {file_path}")
+            rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python(skip_empty_area=False)
+            worksheet = _PreloadedXlsSheet(rows)
+        else:
+            import xlrd
+
+            # Open XLS file
+            logger.info(f"Loading XLS file: {file_path}")
+            workbook = xlrd.open_workbook(file_path)
+            worksheet = workbook.sheet_by_index(0)  # Use first sheet
+
         total_rows = worksheet.nrows
         logger.info(f"Total rows detected: {total_rows}")
         
@@ -452,6 +665,7 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
         
         # Extract headers from first and second rows
         title_headers, actual_headers, max_columns = get_column_headers(worksheet, 'xls')
+        col_names = _build_column_names(title_headers, max_columns)
         logger.info(f"Headers extracted: {len(title_headers)} columns")
         
         # Yield header information first
@@ -492,50 +706,50 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
         total_processed = 0
         end_data_row = data_start_row + rows_to_process
         
+        # Reused across batches - same contract as the xlsx loop
+        batch_data = []
+
         for start_row in range(data_start_row, end_data_row, batch_size):
             batch_count += 1
             memory_monitor.update_peak()
             
             end_row = min(start_row + batch_size, end_data_row)
-            batch_data = []
+            batch_data.clear()
             
             for row_idx in range(start_row, end_row):
                 try:
                     row_values = worksheet.row_values(row_idx)
-                    if row_values and any(cell != '' for cell in row_values):
-                        # Create row dictionary - only include columns with data up to the last meaningful column
-                        row_dict = {}
-                        
-                        # Find the last column with actual data in this row
-                        last_data_col = -1
-                        for i, cell in enumerate(row_values):
-                            if cell is not None and str(cell).strip():
-                                last_data_col = i
-                        
-                        # Only process columns up to the last one with data
-                        if last_data_col >= 0:
-                            for i in range(last_data_col + 1):
-                                cell_value = row_values[i] if i < len(row_values) else None
-                                processed_value = process_cell_value(cell_value)
-                                
-                                # Only include columns that have actual data (not null/empty)
-                                if processed_value is not None and str(processed_value).strip():
-                                    # Generate column name dynamically for each row
-                                    # Check if this column position has a meaningful header from the first row
-                                    if i < len(title_headers) and title_headers[i] and not title_headers[i].startswith('__EMPTY'):
-                                        # Use the actual header from first row
-                                        col_name = title_headers[i]
-                                    else:
-                                        # Generate __EMPTY names based on actual column position
-                                        if i == 0:
-                                            col_name = "__EMPTY"
-                                        else:
-                                            col_name = f"__EMPTY_{i}"
-                                    
-                                    row_dict[col_name] = processed_value
+                    # C-level count replaces the per-cell generator predicate
+                    # (xls empty cells are '' rather than None)
+                    if row_values and len(row_values) != row_values.count(''):
+                        # Same pair-collection scheme as the xlsx loop:
+                        # one dict construction per row instead of
+                        # per-cell __setitem__
+                        keys = []
+                        vals = []
+                        last_data_col = _rfind_nonempty(row_values)
+                        for i in range(last_data_col + 1):
+                            cell_value = row_values[i] if i < len(row_values) else None
+                            cls = cell_value.__class__
+                            if cls is str:
+                                # one strip serves both the emptiness test
+                                # and the stored value
+                                s = cell_value.strip()
+                                if s:
+                                    keys.append(col_names[i])
+                                    vals.append(s)
+                            elif cls is int or cls is float or cls is bool:
+                                # numeric fast path: no stringification at all
+                                keys.append(col_names[i])
+                                vals.append(cell_value)
+                            elif cell_value is not None:
+                                s = str(cell_value).strip()
+                                if s:
+                                    keys.append(col_names[i])
+                                    vals.append(s)
                         
-                        if row_dict:  # Only add non-empty rows
-                            batch_data.append(row_dict)
+                        if keys:  # Only add non-empty rows
+                            batch_data.append(dict(zip(keys, vals)))
                     
                     total_processed += 1
                 except Exception as e:
@@ -544,14 +758,21 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
             
             # Calculate progress
             progress_percentage = (total_processed / max(total_rows - 1, 1)) * 100
-            processing_time = time.time() - start_time
-            
-            logger.info(
-                f"Processed batch {batch_count}: {len(batch_data)} rows, "
-                f"Progress: {progress_percentage:.1f}%, "
-                f"Memory: {memory_monitor.get_memory_info()['current_mb']:.1f}MB"
-            )
+            now = time.monotonic()
+            processing_time = now - start_time
             
+            memory_info = memory_monitor.get_memory_info()
+            # Sampled progress logging: a write per batch turns into real
+            # I/O on big files, so log the first batch and then at most
+            # once per second
+            if batch_count == 1 or now - last_log_time >= 1.0:
+                last_log_time = now
+                logger.info(
+                    f"Processed batch {batch_count}: {len(batch_data)} rows, "
+                    f"Progress: {progress_percentage:.1f}%, "
+                    f"Memory: {memory_info['current_mb']:.1f}MB"
+                )
+
             yield {
                 'type': 'batch',
                 'data': batch_data,
@@ -560,11 +781,11 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
                 'total_processed': total_processed,
                 'progress_percentage': progress_percentage,
                 'processing_time': processing_time,
-                'memory_info': memory_monitor.get_memory_info()
+                'memory_info': memory_info
             }
         
         # Final summary
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         final_memory = memory_monitor.get_memory_info()
         
         logger.info(
@@ -587,6 +808,134 @@ def process_xls_file(file_path: str, batch_size: int = 1000, page: int = None, l
         raise ExcelProcessingError(f"Failed to process XLS file: {str(e)}")
 
 
+@contextmanager
+def _uploaded_file_on_disk(uploaded_file):
+    """
+    Persist an uploaded Excel file to a temporary path for processing.
+
+    Yields (temp_file_path, file_type) and removes the temporary file on
+    exit. Raises ExcelProcessingError for unsupported extensions.
+    """
+    file_name = uploaded_file.name.lower()
+    if file_name.endswith('.xlsx'):
+        file_type = 'xlsx'
+    elif file_name.endswith('.xls'):
+        file_type = 'xls'
+    else:
+        raise ExcelProcessingError("Unsupported file format. Only .xlsx and .xls files are supported.")
+
+    from django.core.files.uploadedfile import TemporaryUploadedFile
+
+    temp_file_path = None
+    own_temp_file = False
+    try:
+        if isinstance(uploaded_file, TemporaryUploadedFile):
+            # Django already spooled the upload to disk - hand that path
+            # to the parser instead of copying the bytes a second time
+            temp_file_path = uploaded_file.temporary_file_path()
+        else:
+            # In-memory upload: spill to a temporary file in large blocks
+            own_temp_file = True
+            with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_type}') as temp_file:
+                temp_file_path = temp_file.name
+                uploaded_file.seek(0)
+                shutil.copyfileobj(uploaded_file, temp_file, length=1 << 20)
+
+        logger.info(
+            f"Processing {file_type.upper()} file: {uploaded_file.name}, "
+            f"Size: {uploaded_file.size / (1024 * 1024):.1f}MB"
+        )
+
+        yield temp_file_path, file_type
+    finally:
+        # Clean up our own temporary file; Django owns the spooled one
+        if own_temp_file and temp_file_path and os.path.exists(temp_file_path):
+            try:
+                os.unlink(temp_file_path)
+            except Exception as e:
+                logger.warning(f"Failed to delete temporary file {temp_file_path}: {str(e)}")
+
+
+def process_excel_batches(uploaded_file, batch_size: int = 1000, page: int = None, limit: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream processing frames for an uploaded Excel file.
+
+    Yields the underlying processor's frames ('headers', 'batch',
+    'summary') one at a time while the temporary file is alive, so
+    callers that consume frames incrementally hold at most one batch of
+    rows in memory regardless of file size.
+
+    The 'data' list in batch frames is reused between batches; consume
+    (or copy) it before advancing to the next frame.
+
+    Args:
+        uploaded_file: Django UploadedFile object
+        batch_size: Number of rows to process in each batch
+        page: Page number for pagination (1-based, optional)
+        limit: Number of rows per page (optional)
+
+    Yields:
+        Processing frames from the per-format processor
+    """
+    with _uploaded_file_on_disk(uploaded_file) as (temp_file_path, file_type):
+        if file_type == 'xlsx':
+            yield from process_xlsx_file(temp_file_path, batch_size, page, limit)
+        else:
+            yield from process_xls_file(temp_file_path, batch_size, page, limit)
+
+
+def iter_excel_ndjson(uploaded_file, batch_size: int = 1000, page: int = None, limit: int = None) -> Iterator[bytes]:
+    """
+    Stream an uploaded Excel file as newline-delimited JSON bytes.
+
+    Each yielded bytes object is one processed batch with one orjson-encoded
+    row object per line, ready to be written to an NDJSON response or file.
+    Rows are encoded and released batch-by-batch, so peak memory stays at
+    one batch regardless of file size.
+
+    Args:
+        uploaded_file: Django UploadedFile object
+        batch_size: Number of rows to process in each batch
+        page: Page number for pagination (1-based, optional)
+        limit: Number of rows per page (optional)
+
+    Yields:
+        NDJSON-encoded bytes, one batch at a time
+    """
+    import orjson
+
+    dumps = orjson.dumps
+    newline = orjson.OPT_APPEND_NEWLINE
+    for result in process_excel_batches(uploaded_file, batch_size, page, limit):
+        if result['type'] == 'batch' and result['data']:
+            yield b''.join(dumps(row, option=newline) for row in result['data'])
+
+
+def rows_to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Transpose row dicts into a dict of per-column value lists.
+
+    Rows are heterogeneous (cells absent per row), so missing cells are
+    filled with None to keep every column list one slot per row. Column
+    order follows first appearance across the rows. For wide repetitive
+    sheets this drops the per-row dict overhead and repeated key strings
+    from the payload.
+    """
+    columns: Dict[str, List[Any]] = {}
+    row_count = 0
+    for row in rows:
+        for key, value in row.items():
+            col = columns.get(key)
+            if col is None:
+                col = columns[key] = [None] * row_count
+            col.append(value)
+        row_count += 1
+        for col in columns.values():
+            if len(col) < row_count:
+                col.append(None)
+    return columns
+
+
 def process_excel_streaming(uploaded_file, batch_size: int = 1000, page: int = None, limit: int = None) -> Dict[str, Any]:
     """
     Main function to process Excel file with streaming support and optional pagination.
@@ -601,137 +950,119 @@ def process_excel_streaming(uploaded_file, batch_size: int = 1000, page: int = N
         Dictionary containing the processed data, metadata, and pagination info
     """
     start_time = time.time()
-    temp_file_path = None
-    
+
     try:
-        # Determine file type from extension
-        file_name = uploaded_file.name.lower()
-        if file_name.endswith('.xlsx'):
-            file_type = 'xlsx'
-        elif file_name.endswith('.xls'):
-            file_type = 'xls'
-        else:
-            raise ExcelProcessingError("Unsupported file format. Only .xlsx and .xls files are supported.")
-        
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_type}') as temp_file:
-            temp_file_path = temp_file.name
-            for chunk in uploaded_file.chunks():
-                temp_file.write(chunk)
-        
-        logger.info(
-            f"Processing {file_type.upper()} file: {uploaded_file.name}, "
-            f"Size: {uploaded_file.size / (1024 * 1024):.1f}MB"
-        )
-        
-        # Process file based on type
-        if file_type == 'xlsx':
-            processor = process_xlsx_file(temp_file_path, batch_size, page, limit)
-        else:
-            processor = process_xls_file(temp_file_path, batch_size, page, limit)
-        
-        # Collect all data
-        all_data = []
-        title_headers = []
-        actual_headers = []
-        summary_info = {}
-        
-        for result in processor:
-            if result['type'] == 'headers':
-                title_headers = result['data']
-                actual_headers = result['actual_headers']
-                
-                # For this type of file, we don't add a header mapping row
-                # The first row of actual data will be the first object
-                # This handles files where each row has different content structure
-                
-            elif result['type'] == 'batch':
-                all_data.extend(result['data'])
-            elif result['type'] == 'summary':
-                summary_info = result
-        
-        # Calculate pagination metadata if pagination was used
-        original_total_rows = len(all_data)
-        pagination_info = None
-        
-        if page is not None and limit is not None:
-            # We need to get the total rows from the file, not from processed data
-            # The processed data is already paginated at the file level
-            file_total_rows = summary_info.get('file_total_rows', len(all_data))
-            
-            # Create pagination metadata
-            total_pages = (file_total_rows + limit - 1) // limit  # Ceiling division
-            has_next = page < total_pages
-            has_prev = page > 1
-            
-            # Calculate the actual range that was processed
-            start_index = (page - 1) * limit + 1  # 1-based indexing
-            end_index = start_index + len(all_data) - 1 if all_data else start_index - 1
+        frames = process_excel_batches(uploaded_file, batch_size, page, limit)
+        return _collect_excel_result(uploaded_file, frames, batch_size, page, limit, start_time)
+
+    except ExcelProcessingError:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error during Excel processing: {str(e)}")
+        raise ExcelProcessingError(f"Unexpected error: {str(e)}")
+
+
+def _collect_excel_result(uploaded_file, frames: Iterator[Dict[str, Any]],
+                          batch_size: int, page: int, limit: int, start_time: float) -> Dict[str, Any]:
+    """
+    Materialize a frame stream into the full response dict.
+
+    The single-JSON-array response contract of the convert endpoint needs
+    every row in one payload, so this is the one consumer that still
+    accumulates; streaming consumers should use process_excel_batches or
+    iter_excel_ndjson directly.
+    """
+    file_type = 'xlsx' if uploaded_file.name.lower().endswith('.xlsx') else 'xls'
+
+    # Collect all data
+    all_data = []
+    title_headers = []
+    actual_headers = []
+    summary_info = {}
+    
+    for result in frames:
+        if result['type'] == 'headers':
+            title_headers = result['data']
+            actual_headers = result['actual_headers']
             
-            pagination_info = {
-                'page': page,
-                'limit': limit,
-                'total_rows': file_total_rows,
-                'total_pages': total_pages,
-                'current_page_rows': len(all_data),
-                'has_next': has_next,
-                'has_prev': has_prev,
-                'start_index': start_index if all_data else 0,
-                'end_index': end_index if all_data else 0
-            }
+            # For this type of file, we don't add a header mapping row
+            # The first row of actual data will be the first object
+            # This handles files where each row has different content structure
             
-            logger.info(
-                f"Pagination metadata: Page {page}/{total_pages}, "
-                f"Showing rows {pagination_info['start_index']}-{pagination_info['end_index']} "
-                f"of {file_total_rows} total rows"
-            )
+        elif result['type'] == 'batch':
+            all_data.extend(result['data'])
+        elif result['type'] == 'summary':
+            summary_info = result
+    
+    # Calculate pagination metadata if pagination was used
+    original_total_rows = len(all_data)
+    pagination_info = None
+    
+    if page is not None and limit is not None:
+        # We need to get the total rows from the file, not from processed data
+        # The processed data is already paginated at the file level
+        file_total_rows = summary_info.get('file_total_rows', len(all_data))
         
-        # Calculate final metadata
-        total_time = time.time() - start_time
-        file_size_mb = uploaded_file.size / (1024 * 1024)
+        # Create pagination metadata
+        total_pages = (file_total_rows + limit - 1) // limit  # Ceiling division
+        has_next = page < total_pages
+        has_prev = page > 1
         
-        metadata = {
-            'total_rows': len(all_data),  # Current page rows (or all rows if no pagination)
-            'original_total_rows': original_total_rows,  # Always show total rows in file
-            'processing_time': round(total_time, 3),
-            'file_size': f"{file_size_mb:.1f}MB",
-            'worksheet_name': 'Sheet1',  # Default name, could be enhanced
-            'file_type': file_type.upper(),
-            'batch_size': batch_size,
-            'performance': {
-                'rows_per_second': round(summary_info.get('rows_per_second', 0), 2),
-                'peak_memory_mb': round(summary_info.get('memory_info', {}).get('peak_mb', 0), 1),
-                'total_batches': summary_info.get('total_batches', 0)
-            }
+        # Calculate the actual range that was processed
+        start_index = (page - 1) * limit + 1  # 1-based indexing
+        end_index = start_index + len(all_data) - 1 if all_data else start_index - 1
+        
+        pagination_info = {
+            'page': page,
+            'limit': limit,
+            'total_rows': file_total_rows,
+            'total_pages': total_pages,
+            'current_page_rows': len(all_data),
+            'has_next': has_next,
+            'has_prev': has_prev,
+            'start_index': start_index if all_data else 0,
+            'end_index': end_index if all_data else 0
         }
         
         logger.info(
-            f"Excel processing completed successfully: "
-            f"{metadata['total_rows']} rows, {total_time:.2f}s, "
-            f"{metadata['performance']['rows_per_second']} rows/sec"
+            f"Pagination metadata: Page {page}/{total_pages}, "
+            f"Showing rows {pagination_info['start_index']}-{pagination_info['end_index']} "
+            f"of {file_total_rows} total rows"
         )
-        
-        result = {
-            'success': True,
-            'data': all_data,
-            'metadata': metadata
+    
+    # Calculate final metadata
+    total_time = time.time() - start_time
+    file_size_mb = uploaded_file.size / (1024 * 1024)
+    
+    metadata = {
+        'total_rows': len(all_data),  # Current page rows (or all rows if no pagination)
+        'original_total_rows': original_total_rows,  # Always show total rows in file
+        'processing_time': round(total_time, 3),
+        'file_size': f"{file_size_mb:.1f}MB",
+        'worksheet_name': 'Sheet1',  # Default name, could be enhanced
+        'file_type': file_type.upper(),
+        'batch_size': batch_size,
+        'performance': {
+            'rows_per_second': round(summary_info.get('rows_per_second', 0), 2),
+            'peak_memory_mb': round(summary_info.get('memory_info', {}).get('peak_mb', 0), 1),
+            'total_batches': summary_info.get('total_batches', 0)
         }
+    }
+    
+    logger.info(
+        f"Excel processing completed successfully: "
+        f"{metadata['total_rows']} rows, {total_time:.2f}s, "
+        f"{metadata['performance']['rows_per_second']} rows/sec"
+    )
+    
+    result = {
+        'success': True,
+        'data': all_data,
+        'metadata': metadata
+    }
+    
+    # Add pagination info if pagination was used
+    if pagination_info is not None:
+        result['pagination'] = pagination_info
         
-        # Add pagination info if pagination was used
-        if pagination_info is not None:
-            result['pagination'] = pagination_info
-            
-        return result
-        
-    except ExcelProcessingError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error during Excel processing: {str(e)}")
-        raise ExcelProcessingError(f"Unexpected error: {str(e)}")
-    finally:
-        # Clean up temporary file
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file {temp_file_path}: {str(e)}")
+    return result
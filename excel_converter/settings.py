@@ -112,11 +112,24 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
 FILE_UPLOAD_TEMP_DIR = None
 
+# Stream every upload straight to disk in chunks. The default handler
+# chain would buffer files up to FILE_UPLOAD_MAX_MEMORY_SIZE (100MB
+# here) in RAM per request; with only the disk handler installed the
+# converter reads the spooled file via temporary_file_path() instead of
+# holding the whole payload in memory.
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
     ],
+    # This API serves JSON only and never uses format suffixes; freeing
+    # DRF's reserved 'format' query parameter lets the convert endpoint
+    # use it for the rows/columnar payload switch
+    'URL_FORMAT_OVERRIDE': None,
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.MultiPartParser',
         'rest_framework.parsers.JSONParser',
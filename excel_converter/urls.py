@@ -17,8 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from converter import views as converter_views
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # Fast-path health probe at root, bypassing DRF's renderer stack
+    path('health', converter_views.health_check_fast, name='health-check-fast'),
     path('api/', include('converter.urls')),
     path('', include('converter.urls')),  # Include health endpoint at root
 ]